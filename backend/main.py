@@ -1,39 +1,144 @@
 import os
+import hmac
+import asyncio
+import logging
+import time
+import functools
+import hashlib
+import aiofiles
+from collections import OrderedDict, deque
 from typing import List, Optional
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Request
+from fastapi import FastAPI, HTTPException, Depends, Header, Query, UploadFile, File, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
 from pydantic import BaseModel
 from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
 
-from database import db
-from schemas import Project, Skill, Testimonial, Certificate
+from database import db, utc_now
+from schemas import ProjectIn, SkillIn, TestimonialIn, CertificateIn
 
-app = FastAPI(title="Futuristic Portfolio API")
+logger = logging.getLogger(__name__)
 
+app = FastAPI(title="Futuristic Portfolio API", default_response_class=ORJSONResponse)
+
+# Comma-separated list of allowed origins; defaults to any origin
+FRONTEND_ORIGINS = [o.strip() for o in os.getenv("FRONTEND_ORIGIN", "*").split(",") if o.strip()]
+
+# Explicit method/header lists give constant preflight responses that browsers may cache for a day
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=FRONTEND_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,
 )
 
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for timestamp-named uploads, which never change once written."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 # Ensure uploads directory exists and mount as static for serving uploaded files
 UPLOAD_DIR = os.path.join(os.getcwd(), "uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR), name="uploads")
-
-security = HTTPBearer()
+app.mount("/uploads", ImmutableStaticFiles(directory=UPLOAD_DIR), name="uploads")
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Public read endpoints get a body-hash ETag so repeat requests can be answered with 304
+PUBLIC_CACHE_PREFIXES = ("/api/projects", "/api/skills", "/api/testimonials", "/api/certificates")
+PUBLIC_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=600"
+# Responses that may include drafts (project listings without published=true, project by slug)
+# must reflect admin edits immediately; they revalidate every time via the ETag instead
+REVALIDATE_CACHE_CONTROL = "no-cache"
+PUBLISHED_ONLY_PATHS = ("/api/skills", "/api/testimonials", "/api/certificates")
+
+
+def _public_cache_control(scope) -> str:
+    path = scope["path"]
+    if path in PUBLISHED_ONLY_PATHS:
+        return PUBLIC_CACHE_CONTROL
+    if path == "/api/projects":
+        published = QueryParams(scope["query_string"]).get("published", "")
+        if published.lower() in ("true", "1", "yes", "on"):
+            return PUBLIC_CACHE_CONTROL
+    return REVALIDATE_CACHE_CONTROL
+
+
+class PublicReadETagMiddleware:
+    """Pure ASGI middleware; only GETs on PUBLIC_CACHE_PREFIXES are buffered, everything else passes through."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or not scope["path"].startswith(PUBLIC_CACHE_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        messages = []
+
+        async def buffer(message):
+            messages.append(message)
+
+        await self.app(scope, receive, buffer)
+        start = messages[0]
+        if start["status"] != 200:
+            for message in messages:
+                await send(message)
+            return
+        body = b"".join(m.get("body", b"") for m in messages[1:])
+        etag = f'W/"{hashlib.sha1(body).hexdigest()[:16]}"'
+        headers = MutableHeaders(raw=list(start["headers"]))
+        headers["etag"] = etag
+        headers["cache-control"] = _public_cache_control(scope)
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+            # Keep CORS and cache headers, drop the ones describing the omitted body
+            for name in ("content-length", "content-type"):
+                del headers[name]
+            await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send({"type": "http.response.start", "status": 200, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+
+app.add_middleware(PublicReadETagMiddleware)
+
+
+class TextGZipMiddleware(GZipMiddleware):
+    """GZip that leaves /uploads alone; uploaded images and archives are already compressed."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/uploads"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Registered last so it is the outermost layer: ETags hash the uncompressed body and 304s skip compression
+app.add_middleware(TextGZipMiddleware, minimum_size=512, compresslevel=5)
 
 # Simple token-based auth for demo purposes. In production use proper session/JWT.
 ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "changeme-admin-token")
+_ADMIN_TOKEN_BYTES = ADMIN_TOKEN.encode()
 
 
-def require_admin(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    if not credentials or credentials.credentials != ADMIN_TOKEN:
+async def require_admin(authorization: Optional[str] = Header(None)):
+    # Parse the bearer header directly and compare in constant time
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), _ADMIN_TOKEN_BYTES):
         raise HTTPException(status_code=401, detail="Unauthorized")
     return True
 
@@ -46,26 +151,30 @@ class IDModel(BaseModel):
 def to_dict(doc):
     if not doc:
         return doc
-    d = dict(doc)
-    if "_id" in d:
-        d["id"] = str(d.pop("_id"))
-    # Normalize timestamps
-    for k in ["created_at", "updated_at", "createdAt", "updatedAt"]:
-        if k in d and hasattr(d[k], "isoformat"):
-            try:
-                d[k] = d[k].isoformat()
-            except Exception:
-                pass
-    return d
+    # Motor returns a fresh dict per document, so rename _id in place instead of copying.
+    # Timestamps stay datetimes: read handlers return ORJSONResponse directly, skipping
+    # jsonable_encoder, so orjson formats them as ISO 8601
+    oid = doc.pop("_id", None)
+    if oid is not None:
+        doc["id"] = str(oid)
+    return doc
+
+
+async def log_activity(entry: dict):
+    # Runs after the response, so failures can only be logged, not returned to the client
+    try:
+        await db["activitylog"].insert_one(entry)
+    except Exception:
+        logger.exception("activity log insert failed: %s", entry)
 
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "Portfolio API is running"}
 
 
 @app.get("/schema")
-def get_schema():
+async def get_schema():
     return {
         "collections": [
             "user", "project", "skill", "testimonial", "certificate", "activitylog"
@@ -74,7 +183,7 @@ def get_schema():
 
 
 @app.get("/test")
-def test_database():
+async def test_database():
     status = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -90,7 +199,7 @@ def test_database():
             status["database_name"] = getattr(db, "name", "✅ Connected")
             status["connection_status"] = "Connected"
             try:
-                status["collections"] = db.list_collection_names()
+                status["collections"] = await db.list_collection_names()
             except Exception:
                 pass
     except Exception as e:
@@ -99,19 +208,23 @@ def test_database():
 
 
 # ---------- Startup: Seed sample data if collections are empty ----------
+# Set SEED_SAMPLE_DATA=0 to keep intentionally emptied collections empty across restarts
+SEED_SAMPLE_DATA = os.getenv("SEED_SAMPLE_DATA", "1") == "1"
+
+
 @app.on_event("startup")
-def seed_sample_data():
-    if db is None:
+async def seed_sample_data():
+    if db is None or not SEED_SAMPLE_DATA:
         return
     try:
         # Only seed when empty to avoid duplicates
-        needs_projects = db["project"].count_documents({}) == 0
-        needs_skills = db["skill"].count_documents({}) == 0
-        needs_testimonials = db["testimonial"].count_documents({}) == 0
-        needs_certificates = db["certificate"].count_documents({}) == 0
-        now = datetime.now(timezone.utc)
+        needs_projects = await db["project"].count_documents({}) == 0
+        needs_skills = await db["skill"].count_documents({}) == 0
+        needs_testimonials = await db["testimonial"].count_documents({}) == 0
+        needs_certificates = await db["certificate"].count_documents({}) == 0
+        now = utc_now()
         if needs_projects:
-            db["project"].insert_many([
+            await db["project"].insert_many([
                 {
                     "title": "Nebula UI Kit",
                     "slug": "nebula-ui-kit",
@@ -168,19 +281,19 @@ def seed_sample_data():
                 },
             ])
         if needs_skills:
-            db["skill"].insert_many([
+            await db["skill"].insert_many([
                 {"name": "React", "level": 90, "category": "Frontend", "orderIndex": 0, "published": True, "deleted": False, "created_at": now, "updated_at": now},
                 {"name": "FastAPI", "level": 85, "category": "Backend", "orderIndex": 1, "published": True, "deleted": False, "created_at": now, "updated_at": now},
                 {"name": "MongoDB", "level": 80, "category": "Database", "orderIndex": 2, "published": True, "deleted": False, "created_at": now, "updated_at": now},
                 {"name": "Tailwind CSS", "level": 88, "category": "Frontend", "orderIndex": 3, "published": True, "deleted": False, "created_at": now, "updated_at": now},
             ])
         if needs_testimonials:
-            db["testimonial"].insert_many([
+            await db["testimonial"].insert_many([
                 {"name": "Ava Stone", "role": "Product Lead @ Nova", "quote": "Delivers stunning interfaces with impeccable attention to detail.", "orderIndex": 0, "published": True, "deleted": False, "created_at": now, "updated_at": now},
                 {"name": "Leo Park", "role": "CTO @ Orbit Labs", "quote": "Reliable, fast, and creative — a joy to collaborate with.", "orderIndex": 1, "published": True, "deleted": False, "created_at": now, "updated_at": now},
             ])
         if needs_certificates:
-            db["certificate"].insert_many([
+            await db["certificate"].insert_many([
                 {"title": "Certified FastAPI Developer", "issuer": "FastAPI Academy", "issueDate": "2024-01", "image": "https://images.unsplash.com/photo-1557800636-894a64c1696f?q=80&w=1200&auto=format&fit=crop", "tags": ["backend"], "published": True, "deleted": False, "created_at": now, "updated_at": now},
                 {"title": "MongoDB Essentials", "issuer": "MongoDB University", "issueDate": "2023-09", "image": "https://images.unsplash.com/photo-1556157382-97eda2d62296?q=80&w=1200&auto=format&fit=crop", "tags": ["database"], "published": True, "deleted": False, "created_at": now, "updated_at": now},
             ])
@@ -189,24 +302,117 @@ def seed_sample_data():
         pass
 
 
+# ---------- Startup: Indexes backing the public query patterns ----------
+# Equality-sort-range order: the sort keys come before the deleted $ne range (and, for projects,
+# the optional published filter) so a single index walk yields documents already sorted
+INDEXES = {
+    "project": [
+        ([("slug", 1)], {"unique": True}),
+        ([("featured", -1), ("orderIndex", 1), ("created_at", -1), ("deleted", 1), ("published", 1)], {}),
+        ([("title", "text"), ("shortDesc", "text"), ("tags", "text")], {}),
+    ],
+    "skill": [
+        ([("published", 1), ("orderIndex", 1), ("deleted", 1)], {}),
+        ([("name", "text"), ("category", "text")], {}),
+    ],
+    "testimonial": [
+        ([("published", 1), ("orderIndex", 1), ("deleted", 1)], {}),
+    ],
+    "certificate": [
+        ([("published", 1), ("_id", -1), ("deleted", 1)], {}),
+        ([("title", "text"), ("issuer", "text"), ("tags", "text")], {}),
+    ],
+    "ratelimit": [
+        ([("expires_at", 1)], {"expireAfterSeconds": 0}),
+    ],
+}
+
+
+# Set by ensure_indexes; while False, create_project checks slugs itself
+_slug_index_ready = False
+
+
+@app.on_event("startup")
+async def ensure_indexes():
+    if db is None:
+        return
+    for collection, specs in INDEXES.items():
+        for keys, options in specs:
+            try:
+                await db[collection].create_index(keys, **options)
+            except Exception as e:
+                # A conflicting index or existing duplicate data should not break startup
+                logger.error("Could not create index %s on %s: %s", keys, collection, e)
+    global _slug_index_ready
+    try:
+        info = await db["project"].index_information()
+        _slug_index_ready = any(ix.get("unique") and ix["key"] == [("slug", 1)] for ix in info.values())
+    except Exception:
+        _slug_index_ready = False
+    if not _slug_index_ready:
+        logger.error("Unique slug index is missing on project; falling back to a pre-insert slug lookup")
+
+
 # ---------- File Upload (local storage) ----------
-@app.post("/api/admin/upload")
+@app.post("/api/admin/upload", response_model=None)
 async def upload_file(file: UploadFile = File(...), _: bool = Depends(require_admin)):
     # Save to uploads dir with timestamped name
     ext = os.path.splitext(file.filename)[1]
     safe_ext = ext if len(ext) <= 10 else ext[:10]
-    fname = f"{int(datetime.now().timestamp()*1000)}{safe_ext}"
+    fname = f"{int(time.time()*1000)}{safe_ext}"
     dest = os.path.join(UPLOAD_DIR, fname)
-    content = await file.read()
-    with open(dest, "wb") as f:
-        f.write(content)
+    # Stream to disk in chunks so memory stays bounded and the event loop is not blocked
+    async with aiofiles.open(dest, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
     url = f"/uploads/{fname}"
-    return {"url": url}
+    return ORJSONResponse({"url": url})
 
 
 # ---------- Public Read Endpoints ----------
+# Per-process TTL/LRU cache for public lists; admin writes clear the affected collection.
+# Entries hold the plain result dict and each call wraps it in a fresh ORJSONResponse, because
+# middleware mutates response header lists in place and a Response object cannot be reused.
+READ_CACHE_TTL = 30
+READ_CACHE_MAXSIZE = 256
+_read_cache = {}
+
+
+def cached_read(collection: str):
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(**kwargs):
+            entries = _read_cache.setdefault(collection, OrderedDict())
+            key = tuple(sorted(kwargs.items()))
+            now = time.monotonic()
+            hit = entries.get(key)
+            if hit is not None and hit[0] > now:
+                entries.move_to_end(key)
+                return ORJSONResponse(hit[1])
+            value = await func(**kwargs)
+            entries[key] = (now + READ_CACHE_TTL, value)
+            entries.move_to_end(key)
+            if len(entries) > READ_CACHE_MAXSIZE:
+                entries.popitem(last=False)
+            return ORJSONResponse(value)
+        return wrapper
+    return decorator
+
+
+def invalidate_reads(collection: str):
+    _read_cache.pop(collection, None)
+
+
+# Published listings (the public card view) return slim documents. Any other listing can include
+# drafts, so it doubles as the admin list; it returns full documents so edit forms can PUT them back
+PROJECTION_LIST = {"title": 1, "slug": 1, "shortDesc": 1, "tags": 1, "featured": 1, "orderIndex": 1, "images": {"$slice": 1}, "created_at": 1, "published": 1}
+# Bookkeeping fields the other public lists never display
+PROJECTION_PUBLIC = {"deleted": 0, "published": 0, "created_at": 0, "updated_at": 0}
+
+
 @app.get("/api/projects")
-def list_projects(published: Optional[bool] = None, tag: Optional[str] = None, search: Optional[str] = None, page: int = 1, limit: int = 20):
+@cached_read("project")
+async def list_projects(published: Optional[bool] = None, tag: Optional[str] = None, search: Optional[str] = None, page: int = Query(1, ge=1), limit: int = Query(20, ge=1, le=100)):
     if db is None:
         raise HTTPException(500, "Database not configured")
     q = {"deleted": {"$ne": True}}
@@ -215,210 +421,224 @@ def list_projects(published: Optional[bool] = None, tag: Optional[str] = None, s
     if tag:
         q["tags"] = {"$in": [tag]}
     if search:
-        q["$or"] = [
-            {"title": {"$regex": search, "$options": "i"}},
-            {"shortDesc": {"$regex": search, "$options": "i"}},
-            {"tags": {"$regex": search, "$options": "i"}},
-        ]
-    cursor = db["project"].find(q).sort([("featured", -1), ("orderIndex", 1), ("created_at", -1)])
-    total = db["project"].count_documents(q)
-    items = [to_dict(x) for x in cursor.skip((page-1)*limit).limit(limit)]
+        q["$text"] = {"$search": search}
+    # find().sort().skip().limit() is an index-backed top-K walk; a $facet would fetch every
+    # matched document to feed both branches. Page and count instead overlap their round-trips.
+    projection = PROJECTION_LIST if published is True else None
+    cursor = db["project"].find(q, projection).sort([("featured", -1), ("orderIndex", 1), ("created_at", -1)]).skip((page-1)*limit).limit(limit)
+    items_raw, total = await asyncio.gather(cursor.to_list(length=limit), db["project"].count_documents(q))
+    items = [to_dict(x) for x in items_raw]
     return {"items": items, "total": total, "page": page, "limit": limit}
 
 
 @app.get("/api/projects/{slug}")
-def get_project(slug: str):
+async def get_project(slug: str):
     if db is None:
         raise HTTPException(500, "Database not configured")
-    doc = db["project"].find_one({"slug": slug, "deleted": {"$ne": True}})
+    doc = await db["project"].find_one({"slug": slug, "deleted": {"$ne": True}})
     if not doc:
         raise HTTPException(404, "Not found")
-    return to_dict(doc)
+    return ORJSONResponse(to_dict(doc))
 
 
 @app.get("/api/skills")
-def list_skills(category: Optional[str] = None, search: Optional[str] = None):
+@cached_read("skill")
+async def list_skills(category: Optional[str] = None, search: Optional[str] = None):
     if db is None:
         raise HTTPException(500, "Database not configured")
     q = {"deleted": {"$ne": True}, "published": True}
     if category:
         q["category"] = category
     if search:
-        q["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"category": {"$regex": search, "$options": "i"}},
-        ]
-    items = [to_dict(x) for x in db["skill"].find(q).sort("orderIndex", 1)]
+        q["$text"] = {"$search": search}
+    items = [to_dict(x) async for x in db["skill"].find(q, PROJECTION_PUBLIC).sort("orderIndex", 1)]
     return {"items": items}
 
 
 @app.get("/api/testimonials")
-def list_testimonials():
+@cached_read("testimonial")
+async def list_testimonials():
     if db is None:
         raise HTTPException(500, "Database not configured")
     q = {"deleted": {"$ne": True}, "published": True}
-    items = [to_dict(x) for x in db["testimonial"].find(q).sort("orderIndex", 1)]
+    items = [to_dict(x) async for x in db["testimonial"].find(q, PROJECTION_PUBLIC).sort("orderIndex", 1)]
     return {"items": items}
 
 
 @app.get("/api/certificates")
-def list_certificates(tag: Optional[str] = None, search: Optional[str] = None):
+@cached_read("certificate")
+async def list_certificates(tag: Optional[str] = None, search: Optional[str] = None):
     if db is None:
         raise HTTPException(500, "Database not configured")
     q = {"deleted": {"$ne": True}, "published": True}
     if tag:
         q["tags"] = {"$in": [tag]}
     if search:
-        q["$or"] = [
-            {"title": {"$regex": search, "$options": "i"}},
-            {"issuer": {"$regex": search, "$options": "i"}},
-            {"tags": {"$regex": search, "$options": "i"}},
-        ]
-    items = [to_dict(x) for x in db["certificate"].find(q).sort("_id", -1)]
+        q["$text"] = {"$search": search}
+    items = [to_dict(x) async for x in db["certificate"].find(q, PROJECTION_PUBLIC).sort("_id", -1)]
     return {"items": items}
 
 
 # ---------- Admin CRUD Endpoints (token auth) ----------
 
 # Create
-@app.post("/api/admin/projects")
-def create_project(payload: Project, _: bool = Depends(require_admin)):
+@app.post("/api/admin/projects", response_model=None)
+async def create_project(payload: ProjectIn, background_tasks: BackgroundTasks, _: bool = Depends(require_admin)):
     if db is None:
         raise HTTPException(500, "Database not configured")
-    now = datetime.now(timezone.utc)
-    data = payload.model_dump()
+    now = utc_now()
+    data = payload.model_dump(exclude_none=True)
     data.update({"created_at": now, "updated_at": now})
-    if db["project"].find_one({"slug": data.get("slug")}):
+    # Uniqueness is enforced by the unique slug index; look it up only if the index could not be built
+    if not _slug_index_ready and await db["project"].find_one({"slug": data.get("slug")}, {"_id": 1}):
+        raise HTTPException(400, "Slug already exists")
+    try:
+        _id = (await db["project"].insert_one(data)).inserted_id
+    except DuplicateKeyError:
         raise HTTPException(400, "Slug already exists")
-    _id = db["project"].insert_one(data).inserted_id
-    db["activitylog"].insert_one({"user_email": "admin", "action": "create", "entity": "project", "entity_id": str(_id), "timestamp": now})
-    return {"id": str(_id)}
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "create", "entity": "project", "entity_id": str(_id), "timestamp": now})
+    invalidate_reads("project")
+    return ORJSONResponse({"id": str(_id)})
 
 
-@app.put("/api/admin/projects/{id}")
-def update_project(id: str, payload: Project, _: bool = Depends(require_admin)):
+@app.put("/api/admin/projects/{id}", response_model=None)
+async def update_project(id: str, payload: ProjectIn, background_tasks: BackgroundTasks, _: bool = Depends(require_admin)):
     if db is None:
         raise HTTPException(500, "Database not configured")
-    now = datetime.now(timezone.utc)
+    now = utc_now()
     data = payload.model_dump()
     data.update({"updated_at": now})
-    res = db["project"].update_one({"_id": ObjectId(id)}, {"$set": data})
+    try:
+        res = await db["project"].update_one({"_id": ObjectId(id)}, {"$set": data})
+    except DuplicateKeyError:
+        raise HTTPException(400, "Slug already exists")
     if res.matched_count == 0:
         raise HTTPException(404, "Not found")
-    db["activitylog"].insert_one({"user_email": "admin", "action": "update", "entity": "project", "entity_id": id, "timestamp": now})
-    return {"ok": True}
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "update", "entity": "project", "entity_id": id, "timestamp": now})
+    invalidate_reads("project")
+    return ORJSONResponse({"ok": True})
 
 
-@app.delete("/api/admin/projects/{id}")
-def delete_project(id: str, hard: bool = False, _: bool = Depends(require_admin)):
+@app.delete("/api/admin/projects/{id}", response_model=None)
+async def delete_project(id: str, background_tasks: BackgroundTasks, hard: bool = False, _: bool = Depends(require_admin)):
     if db is None:
         raise HTTPException(500, "Database not configured")
-    now = datetime.now(timezone.utc)
+    now = utc_now()
     if hard:
-        db["project"].delete_one({"_id": ObjectId(id)})
+        await db["project"].delete_one({"_id": ObjectId(id)})
     else:
-        db["project"].update_one({"_id": ObjectId(id)}, {"$set": {"deleted": True, "updated_at": now}})
-    db["activitylog"].insert_one({"user_email": "admin", "action": "delete", "entity": "project", "entity_id": id, "timestamp": now})
-    return {"ok": True}
+        await db["project"].update_one({"_id": ObjectId(id)}, {"$set": {"deleted": True, "updated_at": now}})
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "delete", "entity": "project", "entity_id": id, "timestamp": now})
+    invalidate_reads("project")
+    return ORJSONResponse({"ok": True})
 
 
-@app.post("/api/admin/skills")
-def create_skill(payload: Skill, _: bool = Depends(require_admin)):
-    now = datetime.now(timezone.utc)
-    data = payload.model_dump()
+@app.post("/api/admin/skills", response_model=None)
+async def create_skill(payload: SkillIn, background_tasks: BackgroundTasks, _: bool = Depends(require_admin)):
+    now = utc_now()
+    data = payload.model_dump(exclude_none=True)
     data.update({"created_at": now, "updated_at": now})
-    _id = db["skill"].insert_one(data).inserted_id
-    db["activitylog"].insert_one({"user_email": "admin", "action": "create", "entity": "skill", "entity_id": str(_id), "timestamp": now})
-    return {"id": str(_id)}
+    _id = (await db["skill"].insert_one(data)).inserted_id
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "create", "entity": "skill", "entity_id": str(_id), "timestamp": now})
+    invalidate_reads("skill")
+    return ORJSONResponse({"id": str(_id)})
 
 
-@app.put("/api/admin/skills/{id}")
-def update_skill(id: str, payload: Skill, _: bool = Depends(require_admin)):
-    now = datetime.now(timezone.utc)
+@app.put("/api/admin/skills/{id}", response_model=None)
+async def update_skill(id: str, payload: SkillIn, background_tasks: BackgroundTasks, _: bool = Depends(require_admin)):
+    now = utc_now()
     data = payload.model_dump()
     data.update({"updated_at": now})
-    res = db["skill"].update_one({"_id": ObjectId(id)}, {"$set": data})
+    res = await db["skill"].update_one({"_id": ObjectId(id)}, {"$set": data})
     if res.matched_count == 0:
         raise HTTPException(404, "Not found")
-    db["activitylog"].insert_one({"user_email": "admin", "action": "update", "entity": "skill", "entity_id": id, "timestamp": now})
-    return {"ok": True}
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "update", "entity": "skill", "entity_id": id, "timestamp": now})
+    invalidate_reads("skill")
+    return ORJSONResponse({"ok": True})
 
 
-@app.delete("/api/admin/skills/{id}")
-def delete_skill(id: str, hard: bool = False, _: bool = Depends(require_admin)):
-    now = datetime.now(timezone.utc)
+@app.delete("/api/admin/skills/{id}", response_model=None)
+async def delete_skill(id: str, background_tasks: BackgroundTasks, hard: bool = False, _: bool = Depends(require_admin)):
+    now = utc_now()
     if hard:
-        db["skill"].delete_one({"_id": ObjectId(id)})
+        await db["skill"].delete_one({"_id": ObjectId(id)})
     else:
-        db["skill"].update_one({"_id": ObjectId(id)}, {"$set": {"deleted": True, "updated_at": now}})
-    db["activitylog"].insert_one({"user_email": "admin", "action": "delete", "entity": "skill", "entity_id": id, "timestamp": now})
-    return {"ok": True}
+        await db["skill"].update_one({"_id": ObjectId(id)}, {"$set": {"deleted": True, "updated_at": now}})
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "delete", "entity": "skill", "entity_id": id, "timestamp": now})
+    invalidate_reads("skill")
+    return ORJSONResponse({"ok": True})
 
 
-@app.post("/api/admin/testimonials")
-def create_testimonial(payload: Testimonial, _: bool = Depends(require_admin)):
-    now = datetime.now(timezone.utc)
-    data = payload.model_dump()
+@app.post("/api/admin/testimonials", response_model=None)
+async def create_testimonial(payload: TestimonialIn, background_tasks: BackgroundTasks, _: bool = Depends(require_admin)):
+    now = utc_now()
+    data = payload.model_dump(exclude_none=True)
     data.update({"created_at": now, "updated_at": now})
-    _id = db["testimonial"].insert_one(data).inserted_id
-    db["activitylog"].insert_one({"user_email": "admin", "action": "create", "entity": "testimonial", "entity_id": str(_id), "timestamp": now})
-    return {"id": str(_id)}
+    _id = (await db["testimonial"].insert_one(data)).inserted_id
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "create", "entity": "testimonial", "entity_id": str(_id), "timestamp": now})
+    invalidate_reads("testimonial")
+    return ORJSONResponse({"id": str(_id)})
 
 
-@app.put("/api/admin/testimonials/{id}")
-def update_testimonial(id: str, payload: Testimonial, _: bool = Depends(require_admin)):
-    now = datetime.now(timezone.utc)
+@app.put("/api/admin/testimonials/{id}", response_model=None)
+async def update_testimonial(id: str, payload: TestimonialIn, background_tasks: BackgroundTasks, _: bool = Depends(require_admin)):
+    now = utc_now()
     data = payload.model_dump()
     data.update({"updated_at": now})
-    res = db["testimonial"].update_one({"_id": ObjectId(id)}, {"$set": data})
+    res = await db["testimonial"].update_one({"_id": ObjectId(id)}, {"$set": data})
     if res.matched_count == 0:
         raise HTTPException(404, "Not found")
-    db["activitylog"].insert_one({"user_email": "admin", "action": "update", "entity": "testimonial", "entity_id": id, "timestamp": now})
-    return {"ok": True}
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "update", "entity": "testimonial", "entity_id": id, "timestamp": now})
+    invalidate_reads("testimonial")
+    return ORJSONResponse({"ok": True})
 
 
-@app.delete("/api/admin/testimonials/{id}")
-def delete_testimonial(id: str, hard: bool = False, _: bool = Depends(require_admin)):
-    now = datetime.now(timezone.utc)
+@app.delete("/api/admin/testimonials/{id}", response_model=None)
+async def delete_testimonial(id: str, background_tasks: BackgroundTasks, hard: bool = False, _: bool = Depends(require_admin)):
+    now = utc_now()
     if hard:
-        db["testimonial"].delete_one({"_id": ObjectId(id)})
+        await db["testimonial"].delete_one({"_id": ObjectId(id)})
     else:
-        db["testimonial"].update_one({"_id": ObjectId(id)}, {"$set": {"deleted": True, "updated_at": now}})
-    db["activitylog"].insert_one({"user_email": "admin", "action": "delete", "entity": "testimonial", "entity_id": id, "timestamp": now})
-    return {"ok": True}
+        await db["testimonial"].update_one({"_id": ObjectId(id)}, {"$set": {"deleted": True, "updated_at": now}})
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "delete", "entity": "testimonial", "entity_id": id, "timestamp": now})
+    invalidate_reads("testimonial")
+    return ORJSONResponse({"ok": True})
 
 
-@app.post("/api/admin/certificates")
-def create_certificate(payload: Certificate, _: bool = Depends(require_admin)):
-    now = datetime.now(timezone.utc)
-    data = payload.model_dump()
+@app.post("/api/admin/certificates", response_model=None)
+async def create_certificate(payload: CertificateIn, background_tasks: BackgroundTasks, _: bool = Depends(require_admin)):
+    now = utc_now()
+    data = payload.model_dump(exclude_none=True)
     data.update({"created_at": now, "updated_at": now})
-    _id = db["certificate"].insert_one(data).inserted_id
-    db["activitylog"].insert_one({"user_email": "admin", "action": "create", "entity": "certificate", "entity_id": str(_id), "timestamp": now})
-    return {"id": str(_id)}
+    _id = (await db["certificate"].insert_one(data)).inserted_id
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "create", "entity": "certificate", "entity_id": str(_id), "timestamp": now})
+    invalidate_reads("certificate")
+    return ORJSONResponse({"id": str(_id)})
 
 
-@app.put("/api/admin/certificates/{id}")
-def update_certificate(id: str, payload: Certificate, _: bool = Depends(require_admin)):
-    now = datetime.now(timezone.utc)
+@app.put("/api/admin/certificates/{id}", response_model=None)
+async def update_certificate(id: str, payload: CertificateIn, background_tasks: BackgroundTasks, _: bool = Depends(require_admin)):
+    now = utc_now()
     data = payload.model_dump()
     data.update({"updated_at": now})
-    res = db["certificate"].update_one({"_id": ObjectId(id)}, {"$set": data})
+    res = await db["certificate"].update_one({"_id": ObjectId(id)}, {"$set": data})
     if res.matched_count == 0:
         raise HTTPException(404, "Not found")
-    db["activitylog"].insert_one({"user_email": "admin", "action": "update", "entity": "certificate", "entity_id": id, "timestamp": now})
-    return {"ok": True}
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "update", "entity": "certificate", "entity_id": id, "timestamp": now})
+    invalidate_reads("certificate")
+    return ORJSONResponse({"ok": True})
 
 
-@app.delete("/api/admin/certificates/{id}")
-def delete_certificate(id: str, hard: bool = False, _: bool = Depends(require_admin)):
-    now = datetime.now(timezone.utc)
+@app.delete("/api/admin/certificates/{id}", response_model=None)
+async def delete_certificate(id: str, background_tasks: BackgroundTasks, hard: bool = False, _: bool = Depends(require_admin)):
+    now = utc_now()
     if hard:
-        db["certificate"].delete_one({"_id": ObjectId(id)})
+        await db["certificate"].delete_one({"_id": ObjectId(id)})
     else:
-        db["certificate"].update_one({"_id": ObjectId(id)}, {"$set": {"deleted": True, "updated_at": now}})
-    db["activitylog"].insert_one({"user_email": "admin", "action": "delete", "entity": "certificate", "entity_id": id, "timestamp": now})
-    return {"ok": True}
+        await db["certificate"].update_one({"_id": ObjectId(id)}, {"$set": {"deleted": True, "updated_at": now}})
+    background_tasks.add_task(log_activity, {"user_email": "admin", "action": "delete", "entity": "certificate", "entity_id": id, "timestamp": now})
+    invalidate_reads("certificate")
+    return ORJSONResponse({"ok": True})
 
 
 # Bulk publish/unpublish
@@ -427,12 +647,13 @@ class BulkPublish(BaseModel):
     published: bool
 
 
-@app.post("/api/admin/projects/bulk-publish")
-def bulk_publish_projects(payload: BulkPublish, _: bool = Depends(require_admin)):
-    now = datetime.now(timezone.utc)
+@app.post("/api/admin/projects/bulk-publish", response_model=None)
+async def bulk_publish_projects(payload: BulkPublish, _: bool = Depends(require_admin)):
+    now = utc_now()
     ids = [ObjectId(x) for x in payload.ids]
-    db["project"].update_many({"_id": {"$in": ids}}, {"$set": {"published": payload.published, "updated_at": now}})
-    return {"ok": True}
+    await db["project"].update_many({"_id": {"$in": ids}}, {"$set": {"published": payload.published, "updated_at": now}})
+    invalidate_reads("project")
+    return ORJSONResponse({"ok": True})
 
 
 # Reordering
@@ -440,15 +661,21 @@ class ReorderPayload(BaseModel):
     ordered_ids: List[str]
 
 
-@app.post("/api/admin/projects/reorder")
-def reorder_projects(payload: ReorderPayload, _: bool = Depends(require_admin)):
-    for idx, id in enumerate(payload.ordered_ids):
-        db["project"].update_one({"_id": ObjectId(id)}, {"$set": {"orderIndex": idx}})
-    return {"ok": True}
+@app.post("/api/admin/projects/reorder", response_model=None)
+async def reorder_projects(payload: ReorderPayload, _: bool = Depends(require_admin)):
+    ops = [UpdateOne({"_id": ObjectId(id)}, {"$set": {"orderIndex": idx}}) for idx, id in enumerate(payload.ordered_ids)]
+    if ops:
+        await db["project"].bulk_write(ops, ordered=False)
+    invalidate_reads("project")
+    return ORJSONResponse({"ok": True})
 
 
-# Simple contact endpoint with basic rate limit in-memory (demo)
-_rate_cache = {}
+# Simple contact endpoint with a per-IP rate limit
+RATE_LIMIT = 3
+RATE_WINDOW = 60
+# Fallback when no database is configured; per-process only, LRU-bounded
+RATE_CACHE_MAXSIZE = 10000
+_rate_cache = OrderedDict()
 
 
 class ContactForm(BaseModel):
@@ -457,25 +684,48 @@ class ContactForm(BaseModel):
     message: str
 
 
+async def hit_rate_limit(ip: str) -> bool:
+    """Record a hit for ip and return True if it exceeds RATE_LIMIT per RATE_WINDOW."""
+    if db is not None:
+        # Fixed-window counter shared by all workers; the TTL index on expires_at evicts old windows
+        bucket = int(time.time() // RATE_WINDOW)
+        doc = await db["ratelimit"].find_one_and_update(
+            {"_id": f"{ip}:{bucket}"},
+            {"$inc": {"n": 1}, "$setOnInsert": {"expires_at": datetime.fromtimestamp((bucket + 2) * RATE_WINDOW, timezone.utc)}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return doc["n"] > RATE_LIMIT
+    now = time.monotonic()
+    entry = _rate_cache.get(ip)
+    if entry is None:
+        entry = _rate_cache[ip] = deque(maxlen=RATE_LIMIT)
+        if len(_rate_cache) > RATE_CACHE_MAXSIZE:
+            # LRU bound: drop the least recently seen IP
+            _rate_cache.popitem(last=False)
+    else:
+        _rate_cache.move_to_end(ip)
+    while entry and now - entry[0] >= RATE_WINDOW:
+        entry.popleft()
+    if len(entry) >= RATE_LIMIT:
+        return True
+    entry.append(now)
+    return False
+
+
 @app.post("/api/contact")
 async def contact(form: ContactForm, request: Request):
     ip = request.client.host if request.client else "unknown"
-    now = datetime.now().timestamp()
-    window = 60
-    entry = _rate_cache.get(ip, [])
-    entry = [t for t in entry if now - t < window]
-    if len(entry) >= 3:
+    if await hit_rate_limit(ip):
         raise HTTPException(429, "Too many requests")
-    entry.append(now)
-    _rate_cache[ip] = entry
     if db is not None:
-        db["activitylog"].insert_one({
+        await db["activitylog"].insert_one({
             "user_email": form.email,
             "action": "contact",
             "entity": "message",
             "entity_id": "-",
             "metadata": form.model_dump(),
-            "timestamp": datetime.now(timezone.utc)
+            "timestamp": utc_now()
         })
     return {"ok": True}
 
@@ -483,4 +733,13 @@ async def contact(form: ContactForm, request: Request):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # Multiple workers require an import string rather than the app object
+    uvicorn.run(
+        "backend.main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+    )
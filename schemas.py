@@ -26,7 +26,8 @@ class User(BaseModel):
     is_active: bool = Field(True)
 
 
-class Project(BaseModel):
+class ProjectIn(BaseModel):
+    """Admin request body; timestamps and soft-delete state are managed server-side."""
     title: str
     slug: str
     shortDesc: str = Field(..., description="Short description")
@@ -39,12 +40,16 @@ class Project(BaseModel):
     featured: bool = False
     published: bool = False
     orderIndex: int = 0
+
+
+class Project(ProjectIn):
     createdAt: Optional[datetime] = None
     updatedAt: Optional[datetime] = None
     deleted: bool = False
 
 
-class Skill(BaseModel):
+class SkillIn(BaseModel):
+    """Admin request body; soft-delete state is managed server-side."""
     name: str
     level: int = Field(ge=0, le=100)
     category: str
@@ -52,10 +57,14 @@ class Skill(BaseModel):
     description: Optional[str] = None
     orderIndex: int = 0
     published: bool = True
+
+
+class Skill(SkillIn):
     deleted: bool = False
 
 
-class Testimonial(BaseModel):
+class TestimonialIn(BaseModel):
+    """Admin request body; soft-delete state is managed server-side."""
     name: str
     role: Optional[str] = None
     quote: str
@@ -63,10 +72,14 @@ class Testimonial(BaseModel):
     sourceUrl: Optional[str] = None
     orderIndex: int = 0
     published: bool = False
+
+
+class Testimonial(TestimonialIn):
     deleted: bool = False
 
 
-class Certificate(BaseModel):
+class CertificateIn(BaseModel):
+    """Admin request body; soft-delete state is managed server-side."""
     title: str
     issuer: str
     issueDate: str
@@ -74,6 +87,9 @@ class Certificate(BaseModel):
     description: Optional[str] = None
     tags: List[str] = Field(default_factory=list)
     published: bool = False
+
+
+class Certificate(CertificateIn):
     deleted: bool = False
 
 